@@ -40,6 +40,15 @@ def async_import_reader(
     :return: yield progression and message
     :rtype: <generator <int>, <str>>
     """
+    # Tune the connection for bulk insertions:
+    # The database is being created, there is no need to wait for the data to
+    # be written on disk after each transaction.
+    # PS: These settings are not persistent, they only apply to this connection.
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
+
     # Create project
     yield 0, f"Importing data with {reader}"
     create_table_project(
@@ -117,6 +126,7 @@ def async_import_reader(
     # Create indexes
     yield 99, "Creating indexes..."
     create_indexes(conn)
+    conn.execute(f"PRAGMA synchronous = {synchronous}")
     yield 100, "Indexes created."
 
     # session.add(Selection(name="favoris", description="favoris", count = 0))
@@ -327,11 +327,15 @@ def condition_to_sql(item: dict) -> str:
 
     # Convert [1,2,3] =>  "(1,2,3)"
     if isinstance(value, list) or isinstance(value, tuple):
-        value = (
-            "("
-            + ",".join([f"'{i}'" if isinstance(i, str) else f"{i}" for i in value])
-            + ")"
-        )
+        # Large lists (wordsets) are usually strings: quote them in bulk
+        if value and all(isinstance(i, str) for i in value):
+            value = "('" + "','".join(value) + "')"
+        else:
+            value = (
+                "("
+                + ",".join([f"'{i}'" if isinstance(i, str) else f"{i}" for i in value])
+                + ")"
+            )
 
     if table == "samples":
         condition = f"`sample_{name}`.`{k}` {sql_operator} {value}"
@@ -557,6 +561,7 @@ def build_sql_query(
     offset=0,
     group_by={},
     having={},  # {"op":">", "value": 3  }
+    distinct=True,
     **kwargs,
 ):
     """Build SQL SELECT query
@@ -572,6 +577,8 @@ def build_sql_query(
             If None, offset is not required.
         offset (int): record count per page
         group_by (list/None): list of field you want to group
+        distinct (bool): Use SELECT DISTINCT to remove duplicated rows due to
+            joins on annotations (default: True)
     """
 
     # get samples ids
@@ -584,7 +591,8 @@ def build_sql_query(
     # if group_by:
     #     sql_fields.insert(1, "COUNT() as 'count'")
 
-    sql_query = f"SELECT DISTINCT {','.join(sql_fields)} "
+    sql_query = "SELECT DISTINCT " if distinct else "SELECT "
+    sql_query += f"{','.join(sql_fields)} "
 
     # #Add child count if grouped
     # if grouped:
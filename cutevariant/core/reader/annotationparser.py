@@ -1,5 +1,6 @@
 # Standard imports
 import re
+import sys
 
 # Custom imports
 from .abstractreader import sanitize_field_name
@@ -7,6 +8,10 @@
 
 LOGGER = logger()
 
+# Patterns used to extract annotation fields from the header descriptions
+VEP_FORMAT_PATTERN = re.compile(r"Format: (.+)")
+SNPEFF_FORMAT_PATTERN = re.compile(r"'(.+)'")
+
 # Dicts of default fields depending to the type of files
 # Keys are based on fields in files (in lower case),
 # values are the full description of the field; the name is remaped here as
@@ -223,6 +228,113 @@ def __init__(self):
         # insurance that the fields have been processed before variants.
         self.annotation_field_name = None
 
+        # Name of the field that contains the annotations ("csq", "ann", ...),
+        # and pattern used to extract the annotation field names from its
+        # description. Both are set by subclasses, see parse_fields().
+        self.annotation_key_name = None
+        self.annotation_format_pattern = None
+
+    def parse_fields(self, fields):
+        """Generate fields description
+
+        Called by a reader when its get_fields() method is called and when
+        an annotation parser is set.
+
+        This function parses the special annotation field
+        (see `annotation_key_name`), other fields are yielded without being
+        affected.
+
+        .. seealso:: :meth:`handle_descriptions`
+
+        Input example::
+
+            ({
+            'name': 'generic_field1',
+            'description': ...
+            'category': ...
+            'type': ...
+            },
+            {
+            'name': 'ann',
+            'description': '... annotation_field_name1 | annotation_field_name2 ...',
+            ...
+            })
+
+        Output example::
+
+            ({
+            'name': 'generic_field1',
+            'description': ...
+            'category': ...
+            'type': ...
+            },
+            {
+            'name': 'annotation_field_name1',
+            'description': ...
+            'category': ...
+            'type': ...
+            },
+            {
+            'name': 'annotation_field_name2',
+            'description': ...
+            'category': ...
+            'type': ...
+            })
+
+        .. note:: Names of fields are changed to lowercase.
+
+        :param fields: Generator of fields.
+        :type fields: <generator <dict>>
+        :return: Generator of full fields descriptions.
+        :rtype: <generator <dict>>
+        """
+        self.annotation_field_name = list()
+        annotation_key_name = self.annotation_key_name
+        # PS: fields names are already sanitized by VcfReader get_fields()
+        # annotations field names will be sanitized in handle_descriptions()
+        fields = tuple(fields)
+        # Help to remove duplicated fields from annotations
+        self.variant_field_names = {
+            field["name"] for field in fields if field["name"] != annotation_key_name
+        }
+
+        for field in fields:
+            if field["name"] == annotation_key_name:
+                # Handle description field and parse annotations in it
+                description = field["description"]
+                raw_fields = self.annotation_format_pattern.search(description)[1]
+
+                # yield full remaped field
+                yield from self.handle_descriptions(raw_fields.split("|"))
+            else:
+                # Field is not an annotation: do nothing
+                yield field
+
+    def parse_variants(self, variants):
+        """Generate variants data
+
+        This function removes the annotation key (see `annotation_key_name`)
+        from the variants, and add "annotations" key with the list of
+        annotations.
+
+        .. seealso:: :meth:`handle_annotations`
+
+        :param variants: Generator of variants.
+        :type variants: <generator <dict>>
+        :return: Generator of full variants with "annotations" key.
+        :rtype: <generator <dict>>
+        """
+        if self.annotation_field_name is None:
+            raise Exception("Cannot parse variant without parsing first fields")
+
+        annotation_key_name = self.annotation_key_name
+        for variant in variants:
+            if annotation_key_name in variant:
+                # Modify the current variant:
+                # remove annotation data, replace it with "annotations"
+                self.handle_annotations(annotation_key_name, variant)
+            yield variant
+
     def handle_descriptions(self, raw_fields: list):
         """Construct annotation_field_name with the fields of the file, and
         yield fields (dictionnaries) with the full description of fields of the file.
@@ -253,13 +365,14 @@ def handle_descriptions(self, raw_fields: list):
         :type raw_fields: <list>
         :rtype: <generator <dict>>
         """
+        default_fields = self.annotation_default_fields
+
         for raw_field_name in raw_fields:
             raw_field_name = raw_field_name.strip().lower()
 
             # Remap field name if it is in default ones
-            if raw_field_name in self.annotation_default_fields:
-                _f = self.annotation_default_fields[raw_field_name]
-            else:
+            _f = default_fields.get(raw_field_name)
+            if _f is None:
                 # Sanitize fields names here
                 # PS: If name is in annotation_default_fields it will be modified
                 # by the previous condition.
@@ -285,7 +398,9 @@ def handle_descriptions(self, raw_fields: list):
                 continue
 
             # Append the name of the field
-            self.annotation_field_name.append(_f["name"])
+            # PS: Names are interned because they are used as keys of the
+            # annotations dicts of all variants.
+            self.annotation_field_name.append(sys.intern(_f["name"]))
             # Yield full field
             yield _f
 
@@ -307,27 +422,30 @@ def handle_annotations(self, annotation_key_name, variant):
         a variant.
         """
         raw = variant.pop(annotation_key_name)
-
-        annotations = list()
-        for transcripts in raw.split(","):
-            transcript = transcripts.split("|")
-
-            if len(self.annotation_field_name) != len(transcript):
-                LOGGER.error(
-                    "BaseParser:handle_annotations:: Missing field in the "
-                    "annotations of the following variant:\n%s\n"
-                    "These annotations will be skipped!",
-                    variant,
-                )
-                continue
-
-            annotation = {
-                field_name: transcript[idx]
-                for idx, field_name in enumerate(self.annotation_field_name)
-                # Remove duplicated fields in variants, see handle_descriptions()
-                if field_name is not None
-            }
-            annotations.append(annotation)
+        field_names = self.annotation_field_name
+        separator_count = len(field_names) - 1
+
+        transcripts = raw.split(",")
+        # Malformed transcripts (wrong number of fields) are filtered out
+        # before being split
+        annotations = [
+            dict(zip(field_names, transcript.split("|")))
+            for transcript in transcripts
+            if transcript.count("|") == separator_count
+        ]
+
+        if len(annotations) != len(transcripts):
+            LOGGER.error(
+                "BaseParser:handle_annotations:: Missing field in the "
+                "annotations of the following variant:\n%s\n"
+                "These annotations will be skipped!",
+                variant,
+            )
+
+        if None in field_names:
+            # Remove duplicated fields in variants, see handle_descriptions()
+            for annotation in annotations:
+                annotation.pop(None, None)
 
         # Avoid setting empty list to the variant => generates a SQL query issue
         if annotations:
@@ -346,66 +464,10 @@ def __init__(self):
         # Dict of dicts
         # annotation field name as keys, descriptions (name/value) as values
         self.annotation_default_fields = VEP_ANNOTATION_DEFAULT_FIELDS
-
-    def parse_fields(self, fields):
-        """Generate fields description
-
-        Called by a reader when its get_fields() method is called and when
-        an annotation parser is set.
-
-        This function parses special annotation field "csq"/"CSQ",
-        other fields are yielded without being affected.
-
-        .. seealso:: :meth:`handle_descriptions`
-
-        :param fields: Tuple of fields.
-        :type fields: <tuple <dict>>
-        :return: Generator of fields descriptions.
-        :rtype: <generator <dict>>
-        """
-        self.annotation_field_name = list()
-        # PS: fields names are already sanitized by VcfReader get_fields()
-        # annotations field names will be sanitized in handle_descriptions()
-
-        # Help to remove duplicated fields from annotations
-        self.variant_field_names = {
-            field["name"] for field in fields if field["name"] != "csq"
-        }
-
-        for field in fields:
-            if field["name"] == "csq":
-                # Handle description field and parse annotations in it
-                description = field["description"]
-                # Assume description looks like this :
-                # ##INFO=<ID=CSQ,Number=.,Type=String,Description="Consequence annotations from Ensembl VEP. Format: field1|field2|..."
-
-                raw_fields = re.search("Format: (.+)", description)[1].split("|")
-
-                # yield full remaped field
-                yield from self.handle_descriptions(raw_fields)
-            else:
-                yield field
-
-    def parse_variants(self, variants):
-        """Generate variants data
-
-        This function removes the key "csq" from the variants,
-        and add "annotations" key with the list of annotations.
-
-        .. seealso:: :meth:`handle_annotations`
-
-        :param variants: Generator of variants.
-        :type variants: <generator <dict>>
-        :return: Generator of full variants with "annotations" key.
-        :rtype: <generator <dict>>
-        """
-        if self.annotation_field_name is None:
-            raise Exception("Cannot parse variant without parsing first fields")
-
-        for variant in variants:
-            if "csq" in variant:
-                self.handle_annotations("csq", variant)
-            yield variant
+        # Assume description looks like this :
+        # ##INFO=<ID=CSQ,Number=.,Type=String,Description="Consequence annotations from Ensembl VEP. Format: field1|field2|..."
+        self.annotation_key_name = "csq"
+        self.annotation_format_pattern = VEP_FORMAT_PATTERN
 
 
 class SnpEffParser(BaseParser):
@@ -423,101 +485,7 @@ def __init__(self):
         # Dict of dicts
         # annotation field name as keys, descriptions (name/value) as values
         self.annotation_default_fields = SNPEFF_ANNOTATION_DEFAULT_FIELDS
-
-    def parse_fields(self, fields):
-        """Generate fields description
-
-        Called by a reader when its get_fields() method is called and when
-        an annotation parser is set.
-
-        This function parses special annotation field "ann"/"ANN",
-        other fields are yielded without being affected.
-
-        .. seealso:: :meth:`handle_descriptions`
-
-        Input example::
-
-            ({
-            'name': 'generic_field1',
-            'description': ...
-            'category': ...
-            'type': ...
-            },
-            {
-            'name': 'ann',
-            'description': '... annotation_field_name1 | annotation_field_name2 ...',
-            ...
-            })
-
-        Output example::
-
-            ({
-            'name': 'generic_field1',
-            'description': ...
-            'category': ...
-            'type': ...
-            },
-            {
-            'name': 'annotation_field_name1',
-            'description': ...
-            'category': ...
-            'type': ...
-            },
-            {
-            'name': 'annotation_field_name2',
-            'description': ...
-            'category': ...
-            'type': ...
-            })
-
-        .. note:: Names of fields are changed to lowercase.
-
-        :param fields: Generator of fields.
-        :type fields: <generator <dict>>
-        :return: Generator of full fields descriptions.
-        :rtype: <generator <dict>>
-        """
-        self.annotation_field_name = list()
-        fields = tuple(fields)
-        # Help to remove duplicated fields from annotations
-        self.variant_field_names = {
-            field["name"] for field in fields if field["name"] != "ann"
-        }
-
-        for field in fields:
-            if field["name"] == "ann":
-                # Handle description field and parse annotations in it
-                description = field["description"]
-                # Assume description looks like this :
-                # INFO=<ID=ANN,Number=.,Type=String,Description="Functional annotations: 'field1 | field2 | ...' ">
-
-                raw_fields = re.search("'(.+)'", description)[1].split("|")
-
-                # yield full remaped field
-                yield from self.handle_descriptions(raw_fields)
-            else:
-                # Field is not an annotation: do nothing
-                yield field
-
-    def parse_variants(self, variants):
-        """Generate variants data
-
-        This function removes the key "ann" from the variants,
-        and add "annotations" key with the list of annotations.
-
-        .. seealso:: :meth:`handle_annotations`
-
-        :param variants: Generator of variants.
-        :type variants: <generator <dict>>
-        :return: Generator of full variants with "annotations" key.
-        :rtype: <generator <dict>>
-        """
-        if self.annotation_field_name is None:
-            raise Exception("Cannot parse variant without parsing first fields")
-
-        for variant in variants:
-            if "ann" in variant:
-                # Modify the current variant:
-                # remove "ann" data, replace it with "annotations"
-                self.handle_annotations("ann", variant)
-            yield variant
+        # Assume description looks like this :
+        # INFO=<ID=ANN,Number=.,Type=String,Description="Functional annotations: 'field1 | field2 | ...' ">
+        self.annotation_key_name = "ann"
+        self.annotation_format_pattern = SNPEFF_FORMAT_PATTERN
@@ -1,46 +1,127 @@
 from .abstractreader import AbstractReader
 
+# Fake data, defined once; see FakeReader
+FAKE_VARIANTS = (
+    {
+        "chr": "11",
+        "pos": 125010,
+        "ref": "T",
+        "alt": "A",
+        "annotations": [
+            {"transcript": "NM_234234", "gene": "CFTR", "ref": "NN"},
+            {"transcript": "NM_234235", "gene": "CFTR", "ref": "NN"},
+        ],
+        "samples": [{"name": "sacha", "gt": 1, "dp": 30}],
+    },
+    {
+        "chr": "12",
+        "pos": 125010,
+        "ref": "T",
+        "alt": "A",
+        "annotations": [
+            {"transcript": "NM_234234", "gene": "CFTR", "ref": "YY"},
+            {"transcript": "NM_234235", "gene": "CFTR", "ref": "YY"},
+        ],
+        "samples": [{"name": "sacha", "gt": 1, "dp": 50}],
+    },
+    {
+        "chr": "13",
+        "pos": 125010,
+        "ref": "T",
+        "alt": "A",
+        "annotations": [
+            {"transcript": "NM_234234", "gene": "CFTR"},
+            {"transcript": "NM_234235", "gene": "CFTR"},
+        ],
+        "samples": [{"name": "sacha", "gt": 1, "dp": 10}],
+    },
+)
+
+FAKE_FIELDS = (
+    {
+        "name": "chr",
+        "category": "variants",
+        "description": "chromosom",
+        "type": "str",
+        "constraint": "NOT NULL",
+    },
+    {
+        "name": "pos",
+        "category": "variants",
+        "description": "position",
+        "type": "int",
+        "constraint": "NOT NULL",
+    },
+    {
+        "name": "ref",
+        "category": "variants",
+        "description": "reference base",
+        "type": "str",
+        "constraint": "NOT NULL",
+    },
+    {
+        "name": "alt",
+        "category": "variants",
+        "description": "alternative base",
+        "type": "str",
+        "constraint": "NOT NULL",
+    },
+    {
+        "name": "gt",
+        "category": "samples",
+        "description": "genotype",
+        "type": "int",
+    },
+    {
+        "name": "dp",
+        "category": "samples",
+        "description": "genotype depth",
+        "type": "int",
+    },
+    {
+        "name": "af",
+        "category": "samples",
+        "description": "allele frequency",
+        "type": "float",
+    },
+    {
+        "name": "gene",
+        "category": "annotations",
+        "description": "gene name",
+        "type": "str",
+    },
+    {
+        "name": "transcript",
+        "category": "annotations",
+        "description": "gene transcripts",
+        "type": "str",
+    },
+    {
+        "name": "ref",
+        "category": "annotations",
+        "description": "duplicate test",
+        "type": "str",
+    },
+)
+
 
 class FakeReader(AbstractReader):
     def __init__(self):
         super().__init__(None)
 
     def get_variants(self):
-        yield {
-            "chr": "11",
-            "pos": 125010,
-            "ref": "T",
-            "alt": "A",
-            "annotations": [
-                {"transcript": "NM_234234", "gene": "CFTR", "ref": "NN"},
-                {"transcript": "NM_234235", "gene": "CFTR", "ref": "NN"},
-            ],
-            "samples": [{"name": "sacha", "gt": 1, "dp": 30}],
-        }
-
-        yield {
-            "chr": "12",
-            "pos": 125010,
-            "ref": "T",
-            "alt": "A",
-            "annotations": [
-                {"transcript": "NM_234234", "gene": "CFTR", "ref": "YY"},
-                {"transcript": "NM_234235", "gene": "CFTR", "ref": "YY"},
-            ],
-            "samples": [{"name": "sacha", "gt": 1, "dp": 50}],
-        }
+        """Yield copies of the fake variants
 
-        yield {
-            "chr": "13",
-            "pos": 125010,
-            "ref": "T",
-            "alt": "A",
-            "annotations": [
-                {"transcript": "NM_234234", "gene": "CFTR"},
-                {"transcript": "NM_234235", "gene": "CFTR"},
-            ],
-            "samples": [{"name": "sacha", "gt": 1, "dp": 10}],
-        }
+        .. note:: Variants are modified in place by
+            :meth:`AbstractReader.get_extra_variants`;
+            the module constants must not be yielded as is.
+        """
+        for variant in FAKE_VARIANTS:
+            yield dict(
+                variant,
+                annotations=[dict(ann) for ann in variant["annotations"]],
+                samples=[dict(sample) for sample in variant["samples"]],
+            )
 
     def get_fields(self):
         """Extract fields informations from VCF fields
@@ -48,78 +129,7 @@ def get_fields(self):
         .. note:: Fields used in PRIMARY KEYS have the constraint NOT NULL.
             By default, all other fields can have NULL values.
         """
-
-        yield {
-            "name": "chr",
-            "category": "variants",
-            "description": "chromosom",
-            "type": "str",
-            "constraint": "NOT NULL",
-        }
-        yield {
-            "name": "pos",
-            "category": "variants",
-            "description": "position",
-            "type": "int",
-            "constraint": "NOT NULL",
-        }
-
-        yield {
-            "name": "ref",
-            "category": "variants",
-            "description": "reference base",
-            "type": "str",
-            "constraint": "NOT NULL",
-        }
-        yield {
-            "name": "alt",
-            "category": "variants",
-            "description": "alternative base",
-            "type": "str",
-            "constraint": "NOT NULL",
-        }
-
-        yield {
-            "name": "gt",
-            "category": "samples",
-            "description": "genotype",
-            "type": "int",
-        }
-
-        yield {
-            "name": "dp",
-            "category": "samples",
-            "description": "genotype depth",
-            "type": "int",
-        }
-
-        yield {
-            "name": "af",
-            "category": "samples",
-            "description": "allele frequency",
-            "type": "float",
-        }
-
-        yield {
-            "name": "gene",
-            "category": "annotations",
-            "description": "gene name",
-            "type": "str",
-        }
-
-        yield {
-            "name": "transcript",
-            "category": "annotations",
-            "description": "gene transcripts",
-            "type": "str",
-        }
-
-        yield {
-            "name": "ref",
-            "category": "annotations",
-            "description": "duplicate test",
-            "type": "str",
-        }
+        yield from FAKE_FIELDS
 
     def get_samples(self):
         return ["sacha"]
@@ -1,5 +1,4 @@
 import os
-import csv
 
 import cutevariant.commons as cm
 
@@ -76,13 +75,17 @@ def __iter__(self):
         PED file is opened as a tabulated or white space separated file.
         """
         with open(self.filepath, "r") as stream:
-            # Sniff dialect of CSV file
-            dialect = csv.Sniffer().sniff(stream.read(10000), delimiters="\t ")
+            # PED files have no quoting: a simple split is enough.
+            # Tabulated files are split on tabs; otherwise fields are split on
+            # any run of white spaces (csv.Sniffer can't detect a delimiter
+            # repeated a variable number of times).
+            delimiter = "\t" if "\t" in stream.read(10000) else None
             stream.seek(0)
 
-            reader = csv.reader(
-                (row for row in stream if not row.startswith("#")),  # Remove comments
-                dialect,
+            reader = (
+                row.rstrip("\r\n").split(delimiter)
+                for row in stream
+                if not row.startswith("#")  # Remove comments
             )
 
             yield from self.get_samples(reader)
@@ -114,6 +117,7 @@ def get_samples(self, reader):
                 `["id": _, "family_id": _, "father_id": _, "mother_id": _, "sex": _, "phenotype": ]`
         """
         samples_mapping = {sample["name"]: sample["id"] for sample in self.samples}
+        get_sample_id = samples_mapping.get
 
         for index, line in enumerate(reader, 1):
             if len(line) < 6:
@@ -124,12 +128,10 @@ def get_samples(self, reader):
                 continue
 
             # Extract and validate data
-            family_id = line[0]
-            individual_id = line[1]
-            father_id = line[2]
-            mother_id = line[3]
-            sex = int(line[4]) if line[4].isdigit() else 0
-            phenotype = int(line[5]) if line[5].isdigit() else 0
+            family_id, individual_id, father_id, mother_id, sex, phenotype = line[:6]
+            # Non-numeric codes (including '-9') are considered as missing data
+            sex = int(sex) if sex.isdigit() else 0
+            phenotype = int(phenotype) if phenotype.isdigit() else 0
 
             if sex not in (0, 1, 2):
                 LOGGER.error(
@@ -143,7 +145,7 @@ def get_samples(self, reader):
                 LOGGER.error(
                     "PED file conformity line <%s>; phenotype code <%s> not expected",
                     index,
-                    sex,
+                    phenotype,
                 )
                 continue
 
@@ -181,8 +183,8 @@ def get_samples(self, reader):
                 new_sample = {
                     "id": samples_mapping[individual_id],  # Get DB sample id
                     "family_id": family_id,
-                    "father_id": samples_mapping.get(father_id, 0),
-                    "mother_id": samples_mapping.get(mother_id, 0),
+                    "father_id": get_sample_id(father_id, 0),
+                    "mother_id": get_sample_id(mother_id, 0),
                     "sex": sex,
                     "phenotype": phenotype,
                 }
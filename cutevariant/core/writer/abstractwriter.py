@@ -47,7 +47,7 @@ def async_save(self, *args, **kwargs):
     def save(self, *args, **kwargs):
 
         for count in self.async_save(args, kwargs):
-            LOGGER.info(f"{count} variants saved")
+            LOGGER.info("%s variants saved", count)
 
     def total_count(self) -> int:
         """
@@ -9,7 +9,7 @@
 from logging import DEBUG
 
 # Qt imports
-from PySide2.QtCore import Qt, QSettings, QByteArray, QDir, QUrl, Signal
+from PySide2.QtCore import Qt, QSettings, QByteArray, QDir, QUrl, QTimer, Signal
 from PySide2.QtWidgets import *
 from PySide2.QtGui import QIcon, QKeySequence, QDesktopServices
 
@@ -100,9 +100,13 @@ def __init__(self, parent=None):
         self.read_settings()
 
         # Auto open recent projects
+        # The opening is deferred to the event loop so that the window is shown
+        # before the plugins load data from the database.
+        # PS: sqlite3 connections can't be shared between threads, so the
+        # project is still opened in the GUI thread.
         recent = self.get_recent_projects()
         if recent and os.path.isfile(recent[0]):
-            self.open(recent[0])
+            QTimer.singleShot(0, partial(self.open, recent[0]))
 
     def add_panel(self, widget, area=Qt.LeftDockWidgetArea):
         """Add given widget to a new QDockWidget and to view menu in menubar"""
@@ -465,6 +469,9 @@ def open_database(self, conn):
             plugin_obj.on_open_project(self.conn)
             plugin_obj.setEnabled(True)
 
+        for dialog_class in self.dialog_plugins.values():
+            dialog_class.on_open_project(self.conn)
+
     def save_recent_project(self, path):
         """Save current project into QSettings
 
@@ -246,6 +246,18 @@ def __init__(self, parent=None):
         super().__init__(parent)
         self.conn = None
 
+    @classmethod
+    def on_open_project(cls, conn):
+        """This method is called when a project is opened
+
+        Dialogs are instantiated on demand; use this class method to reset
+        data shared between instances (caches, etc.).
+
+        Args:
+            conn (sqlite3.connection): A connection to the sqlite project
+        """
+        pass
+
     @property
     def plugin_name(self):
         return cm.camel_to_snake(self.__class__.__name__.replace("Dialog", ""))
@@ -141,6 +141,27 @@ def prepare_fields(conn):
     return results
 
 
+def prepare_completion_model(conn, field):
+    """Return a model of unique values of the given field, shared by completers
+
+    Values are sorted to allow a binary search by the completers.
+
+    Notes:
+        Models are cached until the database is modified through `conn`
+        (`total_changes` is part of the cache key); this covers fields edited
+        by the user like `comment` (see `sql.update_variant`).
+        The cache is also cleared when a project is opened.
+    """
+    return _prepare_completion_model(conn, field, conn.total_changes)
+
+
+@lru_cache()
+def _prepare_completion_model(conn, field, total_changes):
+    """Cached implementation of :meth:`prepare_completion_model`"""
+    values = sql.get_field_unique_values(conn, field, 50)
+    return QStringListModel(sorted(str(value) for value in values if value is not None))
+
+
 class BaseFieldEditor(QFrame):
     """Base class for all editor widgets.
 
@@ -309,12 +330,16 @@ def get_value(self) -> str:
             value = None
         return value
 
-    def set_completion(self, items: list):
-        """Set a completer to autocomplete value"""
-        # self.edit.setCompleter(completer)
+    def set_completion(self, model: QStringListModel):
+        """Set a completer to autocomplete value
+
+        Args:
+            model (QStringListModel): Sorted model of values, see
+                :meth:`prepare_completion_model`.
+        """
         self.completer = QCompleter()
-        self.model = QStringListModel(items)
-        self.completer.setModel(self.model)
+        self.completer.setModel(model)
+        self.completer.setModelSorting(QCompleter.CaseSensitivelySortedModel)
         self.edit.setCompleter(self.completer)
 
 
@@ -569,8 +594,7 @@ def create(self, field: str, operator=None, parent=None):
 
         if field_type == "str":
             w = StrFieldEditor(parent)
-            liste = sql.get_field_unique_values(self.conn, field, 50)
-            w.set_completion(liste)
+            w.set_completion(prepare_completion_model(self.conn, field))
             return w
 
         if field_type == "bool":
@@ -2043,6 +2067,7 @@ def on_open_project(self, conn):
 
         # Clear lru_cache
         prepare_fields.cache_clear()
+        _prepare_completion_model.cache_clear()
         self.on_refresh()
 
     def on_remove_filter(self):
@@ -11,7 +11,7 @@
     QTabWidget,
     QStatusBar,
 )
-from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex, QThreadPool
+from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex
 
 # Custom imports
 from cutevariant.gui.plugin import PluginDialog
@@ -24,74 +24,69 @@
 def get_variant_count(conn: sqlite3.Connection):
     return conn.execute(
         "SELECT `count` FROM selections WHERE name = 'variants'"
-    ).fetchone()["count"]
+    ).fetchone()[0]
 
 
-def get_variant_transition(conn: sqlite3.Connection):
-    return conn.execute(
-        """SELECT COUNT(*) AS `count` FROM variants
-        WHERE (ref == 'A' AND alt == 'G')
-        OR (ref == 'G' AND alt == 'A')
-        OR (ref == 'C' AND alt == 'T')
-        OR (ref == 'T' AND alt == 'C')"""
-    ).fetchone()["count"]
-
-
-def get_variant_transversion(conn: sqlite3.Connection):
-    return conn.execute(
-        """SELECT COUNT(*) AS `count` FROM variants
-        WHERE (ref == 'A' AND alt == 'C')
-        OR (ref == 'C' AND alt == 'A')
-        OR (ref == 'G' AND alt == 'T')
-        OR (ref == 'T' AND alt == 'G')
-        OR (ref == 'G' AND alt == 'C')
-        OR (ref == 'C' AND alt == 'G')
-        OR (ref == 'A' AND alt == 'T')
-        OR (ref == 'T' AND alt == 'A')"""
-    ).fetchone()["count"]
-
-
-def get_sample_count(conn: sqlite3.Connection):
-    return conn.execute("SELECT COUNT(*) AS `count` FROM samples").fetchone()["count"]
+def get_variant_stats(conn: sqlite3.Connection):
+    """Get the counts of SNPs, indels, transitions and transversions
 
+    All the counts are computed in a single scan of the variants table.
 
-def get_snp_count(conn: sqlite3.Connection):
-    """Get the number of variants that are SNP
-
-    Notes:
-        This query is currently not covered by an index.
+    Returns:
+        (sqlite3.Row): Row with `snps`, `indels`, `transitions` and
+            `transversions` keys.
     """
     return conn.execute(
-        "SELECT COUNT(*) AS `count` FROM variants WHERE is_snp = 1"
-    ).fetchone()["count"]
-
+        """SELECT TOTAL(is_snp = 1) AS `snps`,
+        TOTAL(is_indel = 1) AS `indels`,
+        TOTAL(
+            (ref = 'A' AND alt = 'G')
+            OR (ref = 'G' AND alt = 'A')
+            OR (ref = 'C' AND alt = 'T')
+            OR (ref = 'T' AND alt = 'C')
+        ) AS `transitions`,
+        TOTAL(
+            (ref = 'A' AND alt = 'C')
+            OR (ref = 'C' AND alt = 'A')
+            OR (ref = 'G' AND alt = 'T')
+            OR (ref = 'T' AND alt = 'G')
+            OR (ref = 'G' AND alt = 'C')
+            OR (ref = 'C' AND alt = 'G')
+            OR (ref = 'A' AND alt = 'T')
+            OR (ref = 'T' AND alt = 'A')
+        ) AS `transversions`
+        FROM variants"""
+    ).fetchone()
 
-def get_indel_count(conn: sqlite3.Connection):
-    """Get the number of variants that are SNP
 
-    Notes:
-        This query is currently not covered by an index.
-    """
-    return conn.execute(
-        "SELECT COUNT(*) AS `count` FROM variants WHERE is_indel = 1"
-    ).fetchone()["count"]
+def get_sample_count(conn: sqlite3.Connection):
+    return conn.execute("SELECT COUNT(*) FROM samples").fetchone()[0]
 
 
 def get_gene_counts(conn: sqlite3.Connection):
     """ Get the number of variant per genes """
-    results = {}
-    for record in conn.execute(
-        "SELECT gene, COUNT(*) as 'count' FROM annotations GROUP BY gene ORDER by count DESC LIMIT 1,100"
-    ):
-        results[record["gene"]] = record["count"]
-
-    return results
+    return {
+        gene: count
+        for gene, count in conn.execute(
+            "SELECT gene, COUNT(*) as 'count' FROM annotations GROUP BY gene ORDER by count DESC LIMIT 1,100"
+        )
+    }
 
 
 class MetricsDialog(PluginDialog):
 
     ENABLE = True
 
+    # Results of the last computation, shared by all the dialogs
+    # (connection, database version, results)
+    # Reset when a project is opened: see on_open_project()
+    cached_metrics = None
+
+    @classmethod
+    def on_open_project(cls, conn):
+        """Overrided from PluginDialog: drop metrics of the previous project"""
+        cls.cached_metrics = None
+
     def __init__(self, conn=None, parent=None):
         super().__init__(parent)
         self.conn = conn
@@ -123,6 +118,7 @@ def __init__(self, conn=None, parent=None):
         self.resize(640, 480)
         # Async stuff
         self.metric_thread = None
+        self.database_version = None
         self.populate()
 
     def populate(self):
@@ -135,37 +131,92 @@ def populate(self):
         def compute_metrics(conn):
             """Async function"""
 
+            # Tune the thread connection for full scans of the tables.
+            # PS: These settings are not persistent, they only apply to this connection.
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
+            conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
+
+            # All the metrics are read from the same snapshot of the database
+            conn.execute("BEGIN")
+
             meta_data = sql.get_metadatas(conn)
 
+            variant_stats = get_variant_stats(conn)
+
             stats_data = {
                 "Variant count": get_variant_count(conn),
-                "Snp count": get_snp_count(conn),
-                "Indel count": get_indel_count(conn),
-                "Transition count": get_variant_transition(conn),
-                "Transversion count": get_variant_transversion(conn),
+                "Snp count": int(variant_stats["snps"]),
+                "Indel count": int(variant_stats["indels"]),
+                "Transition count": int(variant_stats["transitions"]),
+                "Transversion count": int(variant_stats["transversions"]),
                 "Sample count": get_sample_count(conn),
             }
 
-            stats_data["Tr/tv ratio"] = round(
-                stats_data["Transition count"] / stats_data["Transversion count"], 2
-            )
+            if stats_data["Transversion count"]:
+                stats_data["Tr/tv ratio"] = round(
+                    stats_data["Transition count"] / stats_data["Transversion count"],
+                    2,
+                )
 
             if sql.table_exists(conn, "annotations"):
                 genes_data = get_gene_counts(conn)
             else:
-                gene_data = {}
+                genes_data = {}
+
+            conn.commit()
 
             return meta_data, stats_data, genes_data
 
+        if self.conn is None:
+            self.status_bar.showMessage(self.tr("No project opened"))
+            return
+
+        # Metrics are unchanged if the database has not been modified
+        self.database_version = self.get_database_version()
+        cached_metrics = MetricsDialog.cached_metrics
+        if (
+            cached_metrics
+            and cached_metrics[0] is self.conn
+            and cached_metrics[1] == self.database_version
+        ):
+            self.set_metrics(*cached_metrics[2])
+            return
+
         self.status_bar.showMessage("Loading ...")
         self.metric_thread = SqlThread(self.conn, compute_metrics)
         self.metric_thread.result_ready.connect(self.loaded)
         self.metric_thread.start()
 
+    def get_database_version(self):
+        """Get a key identifying the state of the database
+
+        `data_version` changes when another connection commits to the database;
+        `total_changes` counts the modifications made by our own connection.
+
+        Notes:
+            Both counters are specific to `self.conn` (a new connection starts
+            at the same values); the key must only be compared for the same
+            connection object.
+
+        Returns:
+            (tuple): database file, data_version, total_changes
+        """
+        db_file = sql.get_database_file_name(self.conn)
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return db_file, data_version, self.conn.total_changes
+
     def loaded(self):
         """Called at the end of the thread and populate data"""
-        meta_data, stats_data, genes_data = self.metric_thread.results
-
+        MetricsDialog.cached_metrics = (
+            self.conn,
+            self.database_version,
+            self.metric_thread.results,
+        )
+        self.set_metrics(*self.metric_thread.results)
+
+    def set_metrics(self, meta_data, stats_data, genes_data):
+        """Populate the views with the given metrics"""
         self.stat_view.set_dict(stats_data)
         self.meta_view.set_dict(meta_data)
         self.ann_view.set_dict(genes_data)
@@ -6,10 +6,17 @@
     QSlider,
     QVBoxLayout,
 )
-from PySide2.QtCore import QRect, QPoint, Qt, Slot
+from PySide2.QtCore import QRect, QPoint, Qt, Slot, QTimer
 from PySide2.QtGui import QPainter, QPen, QBrush, QPaintEvent, QColor, QLinearGradient
 import sys
+import numpy as np
 
+# Colors are parsed once
+BACKGROUND_COLOR = QColor(Qt.white)
+INTRON_COLOR = QColor("#FDFD97")
+INTRON_DARK_COLOR = INTRON_COLOR.darker()
+EXON_COLOR = QColor("#789FCC")
+EXON_DARK_COLOR = EXON_COLOR.darker()
 
 # GJB2
 # self.name = "NM_004004"
@@ -55,73 +62,81 @@ def __init__(self, parent=None):
         self.cds_start = 117120148
         self.cds_end = 117307162
 
-        self.exon_starts = [
-            117120078,
-            117144306,
-            117149087,
-            117170952,
-            117174329,
-            117175301,
-            117176601,
-            117180153,
-            117182069,
-            117188694,
-            117199517,
-            117227792,
-            117230406,
-            117231987,
-            117234983,
-            117242879,
-            117243585,
-            117246727,
-            117250572,
-            117251634,
-            117254666,
-            117267575,
-            117282491,
-            117292895,
-            117304741,
-            117305512,
-            117306961,
-        ]
-        self.exon_ends = [
-            117120201,
-            117144417,
-            117149196,
-            117171168,
-            117174419,
-            117175465,
-            117176727,
-            117180400,
-            117182162,
-            117188877,
-            117199709,
-            117227887,
-            117230493,
-            117232711,
-            117235112,
-            117242917,
-            117243836,
-            117246807,
-            117250723,
-            117251862,
-            117254767,
-            117267824,
-            117282647,
-            117292985,
-            117304914,
-            117305618,
-            117308718,
-        ]
+        self.exon_starts = np.array(
+            [
+                117120078,
+                117144306,
+                117149087,
+                117170952,
+                117174329,
+                117175301,
+                117176601,
+                117180153,
+                117182069,
+                117188694,
+                117199517,
+                117227792,
+                117230406,
+                117231987,
+                117234983,
+                117242879,
+                117243585,
+                117246727,
+                117250572,
+                117251634,
+                117254666,
+                117267575,
+                117282491,
+                117292895,
+                117304741,
+                117305512,
+                117306961,
+            ],
+            dtype=np.int32,
+        )
+        self.exon_ends = np.array(
+            [
+                117120201,
+                117144417,
+                117149196,
+                117171168,
+                117174419,
+                117175465,
+                117176727,
+                117180400,
+                117182162,
+                117188877,
+                117199709,
+                117227887,
+                117230493,
+                117232711,
+                117235112,
+                117242917,
+                117243836,
+                117246807,
+                117250723,
+                117251862,
+                117254767,
+                117267824,
+                117282647,
+                117292985,
+                117304914,
+                117305618,
+                117308718,
+            ],
+            dtype=np.int32,
+        )
         self.exon_count = len(self.exon_starts)
 
         # style
         self.exon_height = 30
         self.intron_height = 20
+        self._background_brush = QBrush(BACKGROUND_COLOR)
 
         # self.showMaximized()
 
         self._area = None
+        self._dna_scale = 1
 
         self.scale_factor = 1
         self.translation = 0
@@ -135,6 +150,12 @@ def __init__(self, parent=None):
 
         self.horizontalScrollBar().valueChanged.connect(self.set_translation)
 
+        # Coalesce repaints requested by scrolling/zooming (one per frame at most)
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self.viewport().update)
+
         self.resize(640, 200)
         QScroller.grabGesture(self.viewport(), QScroller.LeftMouseButtonGesture)
 
@@ -142,11 +163,13 @@ def paintEvent(self, event: QPaintEvent):
 
         painter = QPainter()
         painter.begin(self.viewport())
-        painter.setBrush(QBrush(QColor("white")))
+        painter.setBrush(self._background_brush)
         painter.drawRect(self.rect())
 
         # draw guide
-        area = self.draw_area()
+        # The area is computed once per paint and used by coordinate helpers
+        self._update_area()
+        area = self._area
         painter.drawRect(area.adjusted(-2, -2, 2, 2))
 
         self.marks = []
@@ -160,25 +183,25 @@ def paintEvent(self, event: QPaintEvent):
         intron_rect = QRect(area)
         intron_rect.setHeight(self.intron_height)
         intron_rect.moveCenter(QPoint(area.center().x(), area.center().y()))
-        linearGrad = QLinearGradient(
-            QPoint(0, intron_rect.top()), QPoint(0, intron_rect.bottom())
-        )
-        linearGrad.setColorAt(0, QColor("#FDFD97"))
-        linearGrad.setColorAt(1, QColor("#FDFD97").darker())
-        brush = QBrush(linearGrad)
-        painter.setBrush(brush)
+        painter.setBrush(self._intron_brush)
         painter.drawRect(intron_rect)
 
         # draw exons
 
         painter.setClipRect(area)
-        for i in range(self.exon_count):
+        # Compute scrolled pixel coordinates of all exons at once
+        # (see _dna_to_pixel and _pixel_to_scroll)
+        scale = self._dna_scale * self.scale_factor
+        starts = (self.exon_starts - self.tx_start) * scale - self.translation
+        ends = (self.exon_ends - self.tx_start) * scale - self.translation
 
-            start = self._dna_to_pixel(self.exon_starts[i])
-            end = self._dna_to_pixel(self.exon_ends[i])
+        # Skip exons outside of the visible area
+        visible = np.flatnonzero((ends >= 0) & (starts <= area.width()))
 
-            start = self._pixel_to_scroll(start)
-            end = self._pixel_to_scroll(end)
+        painter.setBrush(self._exon_brush)
+        for i, start, end in zip(
+            visible.tolist(), starts[visible].tolist(), ends[visible].tolist()
+        ):
 
             for m in self.marks:
                 print("mark", m)
@@ -191,30 +214,16 @@ def paintEvent(self, event: QPaintEvent):
             )
 
             painter.drawText(exon_rect, Qt.AlignCenter, str(i))
-            linearGrad = QLinearGradient(
-                QPoint(0, exon_rect.top()), QPoint(0, exon_rect.bottom())
-            )
-            linearGrad.setColorAt(0, QColor("#789FCC"))
-            linearGrad.setColorAt(1, QColor("#789FCC").darker())
-            brush = QBrush(linearGrad)
-            painter.setBrush(brush)
             painter.drawRect(exon_rect)
 
         painter.end()
 
     def _pixel_to_dna(self, pixel: int):
-
-        tx_size = self.tx_end - self.tx_start
-        scale = tx_size / self.draw_area().width()
-        return pixel * scale + self.tx_start
+        return pixel / self._dna_scale + self.tx_start
 
     def _dna_to_pixel(self, dna: int):
-
         # normalize dna
-        dna = dna - self.tx_start
-        tx_size = self.tx_end - self.tx_start
-        scale = self.draw_area().width() / tx_size
-        return dna * scale
+        return (dna - self.tx_start) * self._dna_scale
 
     def _pixel_to_scroll(self, pixel):
         return pixel * self.scale_factor - self.translation
@@ -225,6 +234,9 @@ def _scroll_to_pixel(self, pos):
     @Slot(int)
     def set_scale(self, x):
 
+        if x == self.scale_factor:
+            return
+
         self.scale_factor = x
 
         min_scroll = 0
@@ -243,10 +255,17 @@ def set_scale(self, x):
             new = self.horizontalScrollBar().maximum() / 2
 
         self.horizontalScrollBar().setValue(new)
+        # Repaint even if the scroll value is unchanged
+        self.schedule_repaint()
 
     def set_translation(self, x):
         self.translation = x
-        self.viewport().update()
+        self.schedule_repaint()
+
+    def schedule_repaint(self):
+        """Request a viewport update, at most once per timer interval"""
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
     def update_scroll(self):
         pass
@@ -254,13 +273,46 @@ def update_scroll(self):
     def draw_area(self):
         return self.viewport().rect().adjusted(10, 10, -10, -10)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_area()
+        self._update_brushes()
+
+    def _update_area(self):
+        """Cache the draw area and the DNA to pixel scale used by helpers"""
+        self._area = self.draw_area()
+        self._dna_scale = self._area.width() / (self.tx_end - self.tx_start)
+
+    def _update_brushes(self):
+        """Build gradient brushes of introns and exons
+
+        Gradients only depend on the vertical position of the shapes, i.e. on
+        the height of the viewport; they are thus shared by all exons and
+        rebuilt only when the widget is resized.
+        """
+        center_y = self._area.center().y()
+
+        gradient = QLinearGradient(
+            QPoint(0, center_y - self.intron_height // 2),
+            QPoint(0, center_y + self.intron_height // 2),
+        )
+        gradient.setColorAt(0, INTRON_COLOR)
+        gradient.setColorAt(1, INTRON_DARK_COLOR)
+        self._intron_brush = QBrush(gradient)
+
+        gradient = QLinearGradient(
+            QPoint(0, center_y - self.exon_height // 2),
+            QPoint(0, center_y + self.exon_height // 2),
+        )
+        gradient.setColorAt(0, EXON_COLOR)
+        gradient.setColorAt(1, EXON_DARK_COLOR)
+        self._exon_brush = QBrush(gradient)
+
     def wheelEvent(self, event):
 
-        if event.delta() > 0:
-            self.set_scale(self.scale_factor + 0.5)
-        else:
-            if self.scale_factor > 1:
-                self.set_scale(self.scale_factor - 0.5)
+        # Zoom by steps of 0.5; the transcript can't be smaller than the area
+        step = 0.5 if event.delta() > 0 else -0.5
+        self.set_scale(max(1, self.scale_factor + step))
 
     def mousePressEvent(self, event):
 
@@ -70,6 +70,23 @@ def test_condition_to_sql():
         == "`annotations`.`gene` NOT IN ('CFTR','GJB2')"
     )
 
+    # Subclasses of str are quoted like str (ex: numpy.str_)
+    class GeneName(str):
+        pass
+
+    assert (
+        querybuilder.condition_to_sql({"gene": {"$in": [GeneName("CFTR")]}})
+        == "`variants`.`gene` IN ('CFTR')"
+    )
+    assert (
+        querybuilder.condition_to_sql({"gene": {"$in": [GeneName("CFTR"), 2]}})
+        == "`variants`.`gene` IN ('CFTR',2)"
+    )
+    assert (
+        querybuilder.condition_to_sql({"qual": {"$in": []}})
+        == "`variants`.`qual` IN ()"
+    )
+
     assert (
         querybuilder.condition_to_sql({"ann.gene": "CFTR"})
         == "`annotations`.`gene` = 'CFTR'"
@@ -438,19 +455,27 @@ def test_filters(filter_in, expected_sql, expected_vql):
 ]
 
 
+@pytest.fixture(scope="module")
+def samples_conn():
+    """Create fake database with samples, shared by the tests of the module
+
+    This is necessary because querybuilder need to extract samples id.
+    Queries are only built, the database is never modified.
+    """
+    conn = sql.get_sql_connection(":memory:")
+    sql.create_table_samples(conn)
+    sql.insert_many_samples(conn, ["TUMOR", "NORMAL"])
+    yield conn
+    conn.close()
+
+
 @pytest.mark.parametrize(
     "args, expected_sql, expected_vql",
     QUERY_TESTS,
     ids=[str(i) for i in range(len(QUERY_TESTS))],
 )
-def test_build_query(args, expected_sql, expected_vql):
-
-    # Create fake database with samples
-    # This is necessary because querybuilder need to extract samples id
-    conn = sql.get_sql_connection(":memory:")
-    sql.create_table_samples(conn)
-    sql.insert_sample(conn, "TUMOR")
-    sql.insert_sample(conn, "NORMAL")
+def test_build_query(samples_conn, args, expected_sql, expected_vql):
+    conn = samples_conn
 
     # Test SQL query builder
     observed_sql = querybuilder.build_sql_query(conn, **args)
@@ -465,6 +490,16 @@ def test_build_query(args, expected_sql, expected_vql):
     # Ugly .. make it better
 
 
+def test_build_query_without_distinct(samples_conn):
+    observed_sql = querybuilder.build_sql_query(
+        samples_conn, ["chr", "pos"], limit=None, distinct=False
+    )
+    assert (
+        observed_sql
+        == "SELECT `variants`.`id`,`variants`.`chr`,`variants`.`pos` FROM variants"
+    )
+
+
 #     query = querybuilder.build_vql_query(
 #         fields=test_input["fields"],
 #         source=test_input["source"],
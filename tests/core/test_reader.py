@@ -6,9 +6,10 @@
 # Custom imports
 
 from cutevariant.core.reader.abstractreader import nullify
+from cutevariant.core.reader.annotationparser import SnpEffParser
 
 from cutevariant.core.reader import VcfReader, FakeReader
-from cutevariant.core.reader import BedReader
+from cutevariant.core.reader import BedReader, PedReader
 from cutevariant.core.reader import check_variant_schema, check_field_schema
 from cutevariant.core import sql
 
@@ -363,6 +364,89 @@ def test_bedreader_from_file():
     assert bedtool.count == 4
 
 
+def test_malformed_annotations(caplog):
+    """Test that transcripts with a wrong number of fields are skipped"""
+    parser = SnpEffParser()
+    fields = [
+        {
+            "name": "ann",
+            "category": "variants",
+            "type": "str",
+            "description": "Functional annotations: 'Allele | Annotation | Gene_Name' ",
+        }
+    ]
+    list(parser.parse_fields(fields))
+
+    variant = {
+        "chr": "chr1",
+        # Valid transcript, transcripts with too few and too many fields
+        "ann": "A|missense_variant|CFTR,A|missense_variant,A|missense_variant|GJB2|X",
+    }
+    variant = next(parser.parse_variants([variant]))
+
+    assert variant["annotations"] == [
+        {"allele": "A", "consequence": "missense_variant", "gene": "CFTR"}
+    ]
+    assert "ann" not in variant
+
+    # The error is logged once per variant
+    errors = [record for record in caplog.records if record.levelname == "ERROR"]
+    assert len(errors) == 1
+    assert "handle_annotations" in errors[0].getMessage()
+
+
+def test_pedreader_tabulated():
+    """Test PED file with tab separated fields"""
+    samples = list(PedReader("examples/test.snpeff.pedigree.tfam", []))
+
+    # Third sample is not conform (sex and phenotype codes); comment is skipped
+    assert samples == [
+        ["fam", "TUMOR", "0", "0", 1, 2],
+        ["fam", "NORMAL", "TUMOR", "NORMAL", 2, 1],
+    ]
+
+
+def test_pedreader_white_spaces(tmp_path):
+    """Test PED file with fields separated by variable runs of spaces"""
+    pedfile = tmp_path / "test.tfam"
+    pedfile.write_text(
+        "# comment\n"
+        "fam  TUMOR   0 0  1 2\n"
+        "fam NORMAL    TUMOR NORMAL 2   1\n"
+        "fam   COUCOU TUMOR 0 3 3\n"
+    )
+
+    samples = list(PedReader(str(pedfile), []))
+
+    assert samples == [
+        ["fam", "TUMOR", "0", "0", 1, 2],
+        ["fam", "NORMAL", "TUMOR", "NORMAL", 2, 1],
+    ]
+
+    # Samples ready for the database
+    db_samples = [{"id": 1, "name": "TUMOR"}, {"id": 2, "name": "NORMAL"}]
+    samples = list(PedReader(str(pedfile), db_samples, raw_samples=False))
+
+    assert samples == [
+        {
+            "id": 1,
+            "family_id": "fam",
+            "father_id": 0,
+            "mother_id": 0,
+            "sex": 1,
+            "phenotype": 2,
+        },
+        {
+            "id": 2,
+            "family_id": "fam",
+            "father_id": 1,
+            "mother_id": 2,
+            "sex": 2,
+            "phenotype": 1,
+        },
+    ]
+
+
 def test_nullify():
     variant = {
         "chr": "chr3",
@@ -5,7 +5,7 @@
 
 from cutevariant.core import sql
 from cutevariant.core.reader import BedReader
-from tests.utils import table_exists, table_count
+from tests.utils import table_count
 
 
 FIELDS = [
@@ -117,6 +117,12 @@
     },
 ]
 
+# Expected rows of the variants table (without id, annotations and samples)
+VARIANT_ROWS = [
+    tuple(v for k, v in variant.items() if k not in ("annotations", "samples"))
+    for variant in VARIANTS
+]
+
 
 FILTERS = {
     "AND": [
@@ -131,41 +137,62 @@
 }
 
 
-@pytest.fixture
-def conn():
-    """Initialize a memory DB with test data and return a connexion on this DB"""
+@pytest.fixture(scope="module")
+def base_conn():
+    """Initialize a memory DB with test data once for all the tests of the module"""
     conn = sql.get_sql_connection(":memory:")
 
     sql.create_table_project(conn, "test", "hg19")
-    assert table_exists(conn, "projects"), "cannot create table projects"
 
     project_data = sql.get_project(conn)
     assert project_data["name"] == "test"
     assert project_data["reference"] == "hg19"
 
     sql.create_table_fields(conn)
-    assert table_exists(conn, "fields"), "cannot create table fields"
 
     sql.insert_many_fields(conn, FIELDS)
     assert table_count(conn, "fields") == len(FIELDS), "cannot insert many fields"
 
     sql.create_table_selections(conn)
-    assert table_exists(conn, "selections"), "cannot create table selections"
 
     sql.create_table_annotations(conn, sql.get_field_by_category(conn, "annotations"))
-    assert table_exists(conn, "annotations"), "cannot create table annotations"
 
     sql.create_table_samples(conn, sql.get_field_by_category(conn, "samples"))
-    assert table_exists(conn, "samples"), "cannot create table samples"
     sql.insert_many_samples(conn, SAMPLES)
 
     sql.create_table_variants(conn, sql.get_field_by_category(conn, "variants"))
-    assert table_exists(conn, "variants"), "cannot create table variants"
     sql.insert_many_variants(conn, VARIANTS)
 
     sql.create_table_wordsets(conn)
-    assert table_exists(conn, "wordsets"), "cannot create table sets"
 
+    tables = {
+        record[0]
+        for record in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    }
+    expected_tables = {
+        "projects",
+        "fields",
+        "selections",
+        "annotations",
+        "samples",
+        "variants",
+        "wordsets",
+    }
+    assert expected_tables <= tables, "cannot create tables"
+
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def conn(base_conn):
+    """Return a connexion on a fresh copy of the memory DB with test data
+
+    Tests can freely modify the data; the copy is much faster than building
+    the tables again.
+    """
+    conn = sql.get_sql_connection(":memory:")
+    base_conn.backup(conn)
     return conn
 
 
@@ -734,42 +761,46 @@ def test_sql_selection_operation(conn):
 
     # Check if selection of variants returns same data than selection query
     selection_id = 2
-    insert_data = cursor.execute(query).fetchall()
+    insert_data = cursor.execute(f"{query} ORDER BY id").fetchall()
 
     read_data = cursor.execute(
-        f"""
-        SELECT variants.id, variants.chr, variants.pos FROM variants
-        INNER JOIN selection_has_variant sv ON variants.rowid = sv.variant_id AND sv.selection_id = {selection_id}
         """
+        SELECT variants.id, variants.chr, variants.pos FROM variants
+        INNER JOIN selection_has_variant sv ON variants.rowid = sv.variant_id AND sv.selection_id = ?
+        ORDER BY variants.id
+        """,
+        (selection_id,),
     ).fetchall()
 
-    # set because, it can contains duplicate variants
-    assert set(read_data) == set(insert_data)
+    # Both results are sorted by id: compare them as lists
+    assert read_data == insert_data
 
     # TEST Unions
     query1 = "SELECT id, chr, pos FROM variants where alt = 'A' "  # 2 variants
     query2 = "SELECT id, chr, pos FROM variants where alt = 'C' "  # 1 variant
 
     union_query = sql.union_variants(query1, query2)
-    print(union_query)
     selection_id = sql.create_selection_from_sql(conn, union_query, "union_GT")
     print("union_GT selection id: ", selection_id)
     assert selection_id is not None
-    record = cursor.execute(
-        f"SELECT id, name FROM selections WHERE name = 'union_GT'"
-    ).fetchone()
-    print("Found record:", dict(record))
-    selection_id = record[0]
-    selection_name = record[1]
-    assert selection_id == 3  # test if selection id equal 2 ( the first is "variants")
+
+    # All the selections in one query: "variants" (default), "test", "union_GT"
+    selections = cursor.execute(
+        "SELECT id, name, count FROM selections ORDER BY id"
+    ).fetchall()
+    *_, (selection_id, selection_name, selection_count) = selections
+    assert [name for _, name, _ in selections] == ["variants", "test", "union_GT"]
+    assert selection_id == 3  # test if selection id equal 3 ( the first is "variants")
     assert selection_name == "union_GT"
+    assert selection_count == 3
 
     # Select statement from union_GT selection must contains only variant.alt G or T
     records = cursor.execute(
-        f"""
-        SELECT variants.chr, variants.pos, variants.ref, variants.alt FROM variants
-        INNER JOIN selection_has_variant sv ON variants.rowid = sv.variant_id AND sv.selection_id = {selection_id}
         """
+        SELECT variants.chr, variants.pos, variants.ref, variants.alt FROM variants
+        INNER JOIN selection_has_variant sv ON variants.rowid = sv.variant_id AND sv.selection_id = ?
+        """,
+        (selection_id,),
     ).fetchall()
 
     # {'chr': 'chr1', 'pos': 10, 'ref': 'G', 'alt': 'A'}
@@ -784,14 +815,7 @@ def test_sql_selection_operation(conn):
 
 def test_variants(conn):
     """Test that we have all inserted variants in the DB"""
+    # omit id
+    found = [tuple(record)[1:] for record in conn.execute("SELECT * FROM variants")]
 
-    for i, record in enumerate(conn.execute("SELECT * FROM variants")):
-        record = list(record)[1:]  # omit id
-        expected_variant = VARIANTS[i]
-
-        # Check only variants, not annotations or samples
-        for not_wanted_key in ("annotations", "samples"):
-            if not_wanted_key in expected_variant:
-                del expected_variant[not_wanted_key]
-
-        assert tuple(record) == tuple(expected_variant.values())
+    assert found == VARIANT_ROWS